@@ -20,9 +20,9 @@ import { scoreAnswers } from "./scorer.js";
  * 2. Load the content item's questions from DB
  * 3. Score user answers
  * 4. Save assessment result to assessment_results table
- * 5. Dispatch AssessmentResult to master
- * 6. If gaps found, dispatch GapSignal to learning agent
- * 7. Mark original message as done
+ * 5. Dispatch AssessmentResult to master (and, if gaps were found,
+ *    GapSignal to the learning agent) concurrently
+ * 6. Mark original message as done
  */
 export async function handleMessage(msg: AgentMessage): Promise<void> {
   const claimed = await claimMessage(msg.id);
@@ -82,43 +82,49 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
       throw new Error(`Failed to save assessment result: ${insertError.message}`);
     }
 
-    // Dispatch AssessmentResult to master
-    await dispatchMessage({
-      from_agent: "assessment",
-      to_agent: "master",
-      message_type: "AssessmentResult",
-      payload: {
-        user_id: payload.user_id,
-        topic,
-        score: result.score,
-        outcome: result.outcome,
-        recommendation: result.recommendation,
-        gaps: result.gaps,
-        feedback: result.feedback,
-        assessment_result_id: savedResult.id,
-      },
-      status: "pending",
-    });
-
-    // If there are gaps, dispatch GapSignal to learning agent
-    if (result.gaps.length > 0) {
-      await dispatchMessage({
+    // Dispatch AssessmentResult to master and, if there are gaps, GapSignal
+    // to the learning agent — the two are independent, so send them together
+    const dispatches = [
+      dispatchMessage({
         from_agent: "assessment",
-        to_agent: "learning",
-        message_type: "GapSignal",
+        to_agent: "master",
+        message_type: "AssessmentResult",
         payload: {
+          user_id: payload.user_id,
           topic,
           score: result.score,
           outcome: result.outcome,
-          gaps: result.gaps,
           recommendation: result.recommendation,
-          user_id: payload.user_id,
+          gaps: result.gaps,
+          feedback: result.feedback,
           assessment_result_id: savedResult.id,
         },
         status: "pending",
-      });
+      }),
+    ];
+
+    if (result.gaps.length > 0) {
+      dispatches.push(
+        dispatchMessage({
+          from_agent: "assessment",
+          to_agent: "learning",
+          message_type: "GapSignal",
+          payload: {
+            topic,
+            score: result.score,
+            outcome: result.outcome,
+            gaps: result.gaps,
+            recommendation: result.recommendation,
+            user_id: payload.user_id,
+            assessment_result_id: savedResult.id,
+          },
+          status: "pending",
+        })
+      );
     }
 
+    await Promise.all(dispatches);
+
     await completeMessage(msg.id);
   } catch (err) {
     const errorMessage =
@@ -8,13 +8,16 @@ import {
   type Recommendation,
 } from "@adaptlearn/shared/types";
 import { parseJsonFromLLM } from "@adaptlearn/shared/llm-json";
+import {
+  HAIKU_MODEL,
+  getAnthropicClient as getSharedAnthropicClient,
+  resolveModel,
+} from "@adaptlearn/shared/anthropic";
 
 let anthropicClient: Anthropic | null = null;
 
 function getAnthropicClient(): Anthropic {
-  if (anthropicClient) return anthropicClient;
-  anthropicClient = new Anthropic();
-  return anthropicClient;
+  return anthropicClient ?? getSharedAnthropicClient();
 }
 
 /**
@@ -25,13 +28,13 @@ export function scoreMCQ(
   userAnswers: string[],
   questions: Question[]
 ): { answers: AnswerRecord[]; score: number } {
-  const answers: AnswerRecord[] = userAnswers.map((userAnswer, i) => ({
-    question_index: i,
-    user_answer: userAnswer,
-    correct: i < questions.length && userAnswer === questions[i].answer,
-  }));
+  let correctCount = 0;
+  const answers: AnswerRecord[] = userAnswers.map((userAnswer, i) => {
+    const correct = i < questions.length && userAnswer === questions[i].answer;
+    if (correct) correctCount++;
+    return { question_index: i, user_answer: userAnswer, correct };
+  });
 
-  const correctCount = answers.filter((a) => a.correct).length;
   const score = questions.length > 0 ? correctCount / questions.length : 0;
 
   return { answers, score };
@@ -64,7 +67,7 @@ const GAP_ANALYSIS_PROMPT = `You are the Assessment Agent for AdaptLearn, an ada
 
 Given a quiz result (questions, user answers, and score), identify knowledge gaps.
 
-Respond with valid JSON only — no markdown, no extra text:
+Respond with valid JSON only — no markdown, no extra text. Emit compact single-line JSON (the shape below is indented only for readability):
 {
   "score": <0.0 to 1.0>,
   "outcome": "<PASS|PARTIAL|FAIL>",
@@ -91,7 +94,7 @@ export async function analyzeGaps(
   }).join("\n\n");
 
   const response = await client.messages.create({
-    model: "claude-haiku-4-5-20251001",
+    model: resolveModel("GAP_ANALYSIS_MODEL", HAIKU_MODEL),
     max_tokens: 512,
     system: GAP_ANALYSIS_PROMPT,
     messages: [
@@ -5,13 +5,16 @@ import {
   type Depth,
 } from "@adaptlearn/shared/types";
 import { parseJsonFromLLM } from "@adaptlearn/shared/llm-json";
+import {
+  SONNET_MODEL,
+  getAnthropicClient as getSharedAnthropicClient,
+  resolveModel,
+} from "@adaptlearn/shared/anthropic";
 
 let anthropicClient: Anthropic | null = null;
 
 function getAnthropicClient(): Anthropic {
-  if (anthropicClient) return anthropicClient;
-  anthropicClient = new Anthropic();
-  return anthropicClient;
+  return anthropicClient ?? getSharedAnthropicClient();
 }
 
 const LESSON_SYSTEM_PROMPT = `You are the Content Creator for AdaptLearn, an adaptive learning platform for banking professionals.
@@ -30,7 +33,7 @@ Depth levels:
 Each question must have: "q" (question text), "options" (4 choices), "answer" (correct option text), "explanation" (why it's correct).
 Each flashcard must have: "front" (question/prompt), "back" (answer/explanation).
 
-Respond with valid JSON only — no markdown, no extra text:
+Respond with valid JSON only — no markdown, no extra text. Emit compact single-line JSON (the shape below is indented only for readability):
 {
   "prose": "<lesson text>",
   "key_concepts": ["<concept1>", "<concept2>", ...],
@@ -54,7 +57,7 @@ export async function generateLesson(
   const client = getAnthropicClient();
 
   const response = await client.messages.create({
-    model: "claude-sonnet-4-6",
+    model: resolveModel("LESSON_MODEL", SONNET_MODEL),
     max_tokens: 4096,
     system: LESSON_SYSTEM_PROMPT,
     messages: [
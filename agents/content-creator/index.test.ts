@@ -24,6 +24,7 @@ import {
   failMessage,
 } from "@adaptlearn/shared/bus";
 import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { _clearTopicCache } from "@adaptlearn/shared/topics";
 import type { AgentMessage } from "@adaptlearn/shared/types";
 
 const TOPIC_UUID = "00000000-0000-0000-0000-000000000001";
@@ -72,6 +73,7 @@ describe("Content Creator handleMessage", () => {
 
   beforeEach(() => {
     vi.clearAllMocks();
+    _clearTopicCache();
     mockDb = createMockDb();
     vi.mocked(getSupabaseClient).mockReturnValue(mockDb as never);
   });
@@ -5,6 +5,7 @@ import {
   failMessage,
 } from "@adaptlearn/shared/bus";
 import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { resolveTopicId } from "@adaptlearn/shared/topics";
 import type { AgentMessage, Depth } from "@adaptlearn/shared/types";
 import { JobDispatchPayloadSchema } from "@adaptlearn/shared/types";
 import { generateContent } from "./generator.js";
@@ -37,20 +38,7 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
     const skill = extractSkill(payload.raw_input, topic);
 
     // Resolve topic_id
-    const db = getSupabaseClient();
-    let topicId = payload.topic_id;
-
-    if (!topicId) {
-      const { data: topicRow } = await db
-        .from("topics")
-        .select("id")
-        .ilike("name", `%${topic}%`)
-        .eq("is_active", true)
-        .limit(1)
-        .single();
-
-      topicId = topicRow?.id;
-    }
+    const topicId = payload.topic_id ?? (await resolveTopicId(topic));
 
     if (!topicId) {
       throw new Error(`Topic not found in DB: "${topic}"`);
@@ -60,6 +48,7 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
     const content = await generateContent(skill, depth, topic);
 
     // Save to content_items table
+    const db = getSupabaseClient();
     const { data: savedItem, error: insertError } = await db
       .from("content_items")
       .insert({
@@ -105,20 +94,20 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
   }
 }
 
+// Patterns like "lesson on X", "content about X", "teach me X"
+const SKILL_PATTERNS = [
+  /(?:lesson|content|guide)\s+(?:on|about|for)\s+(.+)/i,
+  /(?:teach|learn|study)\s+(?:me\s+)?(?:on|about|for)\s+(.+)/i,
+  /(?:create|generate|make)\s+(?:a\s+)?(?:lesson|content|guide)\s+(?:on|about|for)\s+(.+)/i,
+];
+
 /**
  * Extract a specific skill name from user input.
  * Falls back to the topic name if no skill is explicitly mentioned.
  */
 export function extractSkill(rawInput: string, fallbackTopic: string): string {
-  // Look for patterns like "lesson on X", "content about X", "teach me X"
-  const patterns = [
-    /(?:lesson|content|guide)\s+(?:on|about|for)\s+(.+)/i,
-    /(?:teach|learn|study)\s+(?:me\s+)?(?:on|about|for)\s+(.+)/i,
-    /(?:create|generate|make)\s+(?:a\s+)?(?:lesson|content|guide)\s+(?:on|about|for)\s+(.+)/i,
-  ];
-
-  for (const pattern of patterns) {
-    const match = rawInput.match(pattern);
+  for (const pattern of SKILL_PATTERNS) {
+    const match = pattern.exec(rawInput);
     if (match?.[1]) {
       return match[1].trim();
     }
@@ -26,6 +26,7 @@ import {
   failMessage,
 } from "@adaptlearn/shared/bus";
 import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { _clearTopicCache } from "@adaptlearn/shared/topics";
 import type { AgentMessage } from "@adaptlearn/shared/types";
 
 const TOPIC_UUID = "00000000-0000-0000-0000-000000000001";
@@ -92,6 +93,7 @@ describe("Learning Agent handleMessage", () => {
 
   beforeEach(() => {
     vi.clearAllMocks();
+    _clearTopicCache();
     mockDb = createMockDb();
     vi.mocked(getSupabaseClient).mockReturnValue(mockDb as never);
   });
@@ -186,6 +188,29 @@ describe("Learning Agent handleMessage", () => {
     expect(completeMessage).toHaveBeenCalledWith("msg-002");
   });
 
+  it("updates progress once per distinct gap", async () => {
+    const gapSignal = makeGapSignal({
+      payload: {
+        ...makeGapSignal().payload,
+        gaps: ["RAG Architecture", "RAG Architecture", "Agent Orchestration"],
+      },
+    });
+    vi.mocked(claimMessage).mockResolvedValue({ ...gapSignal, status: "processing" });
+
+    vi.mocked(selectNextContent).mockResolvedValue({
+      nextContentItemId: "content-uuid-002",
+      nextSkill: "RAG Architecture",
+      nextDepth: "beginner",
+      currentStatus: "needs_remediation",
+      message: 'Let\'s review "RAG Architecture".',
+    });
+
+    await handleMessage(gapSignal);
+
+    expect(updateProgress).toHaveBeenCalledTimes(2);
+    expect(completeMessage).toHaveBeenCalledWith("msg-002");
+  });
+
   it("skips if already claimed", async () => {
     vi.mocked(claimMessage).mockResolvedValue(null);
     await handleMessage(makeJobDispatch());
@@ -199,4 +224,20 @@ describe("Learning Agent handleMessage", () => {
     await expect(handleMessage(makeJobDispatch())).rejects.toThrow("DB connection lost");
     expect(failMessage).toHaveBeenCalledWith("msg-001", "DB connection lost");
   });
+
+  it("does not dispatch ProgressUpdate when the progress write fails", async () => {
+    vi.mocked(claimMessage).mockResolvedValue(makeJobDispatch({ status: "processing" }));
+    vi.mocked(selectNextContent).mockResolvedValue({
+      nextContentItemId: "content-uuid-001",
+      nextSkill: "Prompt Engineering",
+      nextDepth: "beginner",
+      currentStatus: "not_started",
+      message: 'Start learning "Prompt Engineering" from the basics.',
+    });
+    vi.mocked(updateProgress).mockRejectedValueOnce(new Error("upsert failed"));
+
+    await expect(handleMessage(makeJobDispatch())).rejects.toThrow("upsert failed");
+    expect(dispatchMessage).not.toHaveBeenCalled();
+    expect(failMessage).toHaveBeenCalledWith("msg-001", "upsert failed");
+  });
 });
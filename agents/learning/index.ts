@@ -4,14 +4,20 @@ import {
   dispatchMessage,
   failMessage,
 } from "@adaptlearn/shared/bus";
-import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { resolveTopicId } from "@adaptlearn/shared/topics";
 import type { AgentMessage, Depth } from "@adaptlearn/shared/types";
 import {
   JobDispatchPayloadSchema,
   GapSignalPayloadSchema,
 } from "@adaptlearn/shared/types";
+import { mapWithConcurrency } from "@adaptlearn/shared/concurrency";
 import { selectNextContent, updateProgress } from "./sequencer.js";
 
+/**
+ * Upper bound on parallel user_progress writes when handling a GapSignal.
+ */
+const MAX_CONCURRENT_PROGRESS_WRITES = 4;
+
 /**
  * Learning Agent — POC v1
  *
@@ -53,21 +59,9 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
 async function handleJobDispatch(msg: AgentMessage): Promise<void> {
   const payload = JobDispatchPayloadSchema.parse(msg.payload);
   const topic = payload.topic ?? "Agentic AI";
-  const db = getSupabaseClient();
 
   // Resolve topic_id
-  let topicId = payload.topic_id;
-  if (!topicId) {
-    const { data: topicRow } = await db
-      .from("topics")
-      .select("id")
-      .ilike("name", `%${topic}%`)
-      .eq("is_active", true)
-      .limit(1)
-      .single();
-
-    topicId = topicRow?.id;
-  }
+  const topicId = payload.topic_id ?? (await resolveTopicId(topic));
 
   if (!topicId) {
     throw new Error(`Topic not found in DB: "${topic}"`);
@@ -114,37 +108,31 @@ async function handleJobDispatch(msg: AgentMessage): Promise<void> {
  */
 async function handleGapSignal(msg: AgentMessage): Promise<void> {
   const payload = GapSignalPayloadSchema.parse(msg.payload);
-  const db = getSupabaseClient();
 
   // Look up the topic_id from the topic name
-  const { data: topicRow } = await db
-    .from("topics")
-    .select("id")
-    .ilike("name", `%${payload.topic}%`)
-    .eq("is_active", true)
-    .limit(1)
-    .single();
-
-  const topicId = topicRow?.id;
+  const topicId = await resolveTopicId(payload.topic);
   if (!topicId) {
     throw new Error(`Topic not found for gap signal: "${payload.topic}"`);
   }
 
-  // Update progress for each gap area
-  for (const gap of payload.gaps) {
-    const currentDepth: Depth =
-      payload.recommendation === "needs_remediation" ? "beginner" : "intermediate";
-
-    await updateProgress(
-      payload.user_id,
-      topicId,
-      gap,
-      "needs_remediation",
-      currentDepth,
-      payload.score,
-      null
-    );
-  }
+  // Update progress once per distinct gap area — the scorer can repeat a gap
+  const currentDepth: Depth =
+    payload.recommendation === "needs_remediation" ? "beginner" : "intermediate";
+
+  await mapWithConcurrency(
+    [...new Set(payload.gaps)],
+    MAX_CONCURRENT_PROGRESS_WRITES,
+    (gap) =>
+      updateProgress(
+        payload.user_id,
+        topicId,
+        gap,
+        "needs_remediation",
+        currentDepth,
+        payload.score,
+        null
+      )
+  );
 
   // Select remediation content
   const recommendation = await selectNextContent(payload.user_id, topicId);
@@ -118,6 +118,21 @@ describe("selectNextContent", () => {
     expect(result.nextSkill).toBe("RAG");
     expect(result.message).toContain("review");
   });
+
+  it("prefers in_progress over not_started and skips completed skills", async () => {
+    mockDb._progressData = [
+      { skill: "Evaluation", status: "completed", current_depth: "advanced" },
+      { skill: "Prompting", status: "not_started", current_depth: "beginner" },
+      { skill: "Tool Use", status: "in_progress", current_depth: "intermediate" },
+    ];
+    mockDb._contentData = { id: "content-003", skill: "Tool Use", depth: "intermediate" };
+
+    const result = await selectNextContent(USER_UUID, TOPIC_UUID);
+
+    expect(result.nextSkill).toBe("Tool Use");
+    expect(result.nextDepth).toBe("intermediate");
+    expect(result.currentStatus).toBe("in_progress");
+  });
 });
 
 describe("updateProgress", () => {
@@ -9,6 +9,16 @@ export interface LearningRecommendation {
   message: string;
 }
 
+/**
+ * Which skills need attention, in order: remediation > in_progress > not_started.
+ * Completed skills are never picked.
+ */
+const STATUS_PRIORITY: Partial<Record<ProgressStatus, number>> = {
+  needs_remediation: 0,
+  in_progress: 1,
+  not_started: 2,
+};
+
 /**
  * Determine the next depth level for a user based on their current progress.
  */
@@ -48,20 +58,20 @@ export async function selectNextContent(
 
   const progress = progressRows ?? [];
 
-  // Find skills needing attention (needs_remediation first, then not_started)
-  const needsRemediation = progress.filter(
-    (p) => p.status === "needs_remediation"
-  );
-  const notStarted = progress.filter((p) => p.status === "not_started");
-  const inProgress = progress.filter((p) => p.status === "in_progress");
-
-  // Priority: remediation > in_progress > not_started
-  const targetProgress = needsRemediation[0] ?? inProgress[0] ?? notStarted[0];
+  // Pick the most recent skill of the highest-priority status in one pass
+  let targetProgress: (typeof progress)[number] | undefined;
+  let targetRank = Infinity;
+  for (const p of progress) {
+    const rank = STATUS_PRIORITY[p.status as ProgressStatus];
+    if (rank !== undefined && rank < targetRank) {
+      targetProgress = p;
+      targetRank = rank;
+      if (rank === 0) break;
+    }
+  }
 
   if (targetProgress) {
-    const depth = targetProgress.status === "needs_remediation"
-      ? targetProgress.current_depth
-      : targetProgress.current_depth;
+    const depth = targetProgress.current_depth;
 
     // Find content at this skill and depth
     const { data: contentItem } = await db
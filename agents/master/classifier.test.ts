@@ -2,13 +2,15 @@ import { describe, it, expect, vi, afterEach } from "vitest";
 import { classifyIntent, _setAnthropicClient } from "./classifier.js";
 
 /**
- * Creates a mock Anthropic client that returns the given JSON string.
+ * Creates a mock Anthropic client that answers with a classify_intent tool call.
  */
-function mockAnthropicWithResponse(jsonText: string) {
+function mockAnthropicWithToolInput(input: Record<string, unknown>) {
   return {
     messages: {
       create: vi.fn().mockResolvedValue({
-        content: [{ type: "text", text: jsonText }],
+        content: [
+          { type: "tool_use", id: "toolu_01", name: "classify_intent", input },
+        ],
       }),
     },
   } as unknown as import("@anthropic-ai/sdk").default;
@@ -20,13 +22,11 @@ describe("classifyIntent", () => {
   });
 
   it("classifies a research intent correctly", async () => {
-    const mock = mockAnthropicWithResponse(
-      JSON.stringify({
-        intent: "research",
-        topic: "Agentic AI",
-        confidence: 0.95,
-      })
-    );
+    const mock = mockAnthropicWithToolInput({
+      intent: "research",
+      topic: "Agentic AI",
+      confidence: 0.95,
+    });
     _setAnthropicClient(mock);
 
     const result = await classifyIntent("What are the top skills for Agentic AI?");
@@ -38,13 +38,11 @@ describe("classifyIntent", () => {
   });
 
   it("classifies a create_content intent correctly", async () => {
-    const mock = mockAnthropicWithResponse(
-      JSON.stringify({
-        intent: "create_content",
-        topic: "Salesforce Agentforce",
-        confidence: 0.88,
-      })
-    );
+    const mock = mockAnthropicWithToolInput({
+      intent: "create_content",
+      topic: "Salesforce Agentforce",
+      confidence: 0.88,
+    });
     _setAnthropicClient(mock);
 
     const result = await classifyIntent(
@@ -57,13 +55,11 @@ describe("classifyIntent", () => {
   });
 
   it("classifies an assess intent correctly", async () => {
-    const mock = mockAnthropicWithResponse(
-      JSON.stringify({
-        intent: "assess",
-        topic: "AI Strategy",
-        confidence: 0.92,
-      })
-    );
+    const mock = mockAnthropicWithToolInput({
+      intent: "assess",
+      topic: "AI Strategy",
+      confidence: 0.92,
+    });
     _setAnthropicClient(mock);
 
     const result = await classifyIntent("Quiz me on AI Strategy");
@@ -73,13 +69,11 @@ describe("classifyIntent", () => {
   });
 
   it("classifies a learn intent correctly", async () => {
-    const mock = mockAnthropicWithResponse(
-      JSON.stringify({
-        intent: "learn",
-        topic: "Agentic AI",
-        confidence: 0.85,
-      })
-    );
+    const mock = mockAnthropicWithToolInput({
+      intent: "learn",
+      topic: "Agentic AI",
+      confidence: 0.85,
+    });
     _setAnthropicClient(mock);
 
     const result = await classifyIntent("What should I study next for Agentic AI?");
@@ -88,12 +82,10 @@ describe("classifyIntent", () => {
   });
 
   it("classifies unknown intent for off-topic messages", async () => {
-    const mock = mockAnthropicWithResponse(
-      JSON.stringify({
-        intent: "unknown",
-        confidence: 0.3,
-      })
-    );
+    const mock = mockAnthropicWithToolInput({
+      intent: "unknown",
+      confidence: 0.3,
+    });
     _setAnthropicClient(mock);
 
     const result = await classifyIntent("What's the weather today?");
@@ -104,18 +96,16 @@ describe("classifyIntent", () => {
   });
 
   it("throws on invalid LLM output (Zod validation)", async () => {
-    const mock = mockAnthropicWithResponse(
-      JSON.stringify({
-        intent: "invalid_intent",
-        confidence: 0.5,
-      })
-    );
+    const mock = mockAnthropicWithToolInput({
+      intent: "invalid_intent",
+      confidence: 0.5,
+    });
     _setAnthropicClient(mock);
 
     await expect(classifyIntent("hello")).rejects.toThrow();
   });
 
-  it("throws when LLM returns no text content", async () => {
+  it("throws when LLM returns no tool call", async () => {
     const mock = {
       messages: {
         create: vi.fn().mockResolvedValue({
@@ -126,14 +116,45 @@ describe("classifyIntent", () => {
     _setAnthropicClient(mock);
 
     await expect(classifyIntent("hello")).rejects.toThrow(
-      "No text response from Claude intent classifier"
+      "No tool call from Claude intent classifier"
     );
   });
 
-  it("throws when LLM returns invalid JSON", async () => {
-    const mock = mockAnthropicWithResponse("not json at all");
+  it("throws on a plain-text answer instead of the tool call", async () => {
+    const mock = {
+      messages: {
+        create: vi.fn().mockResolvedValue({
+          content: [
+            {
+              type: "text",
+              text: JSON.stringify({ intent: "research", confidence: 0.9 }),
+            },
+          ],
+        }),
+      },
+    } as unknown as import("@anthropic-ai/sdk").default;
     _setAnthropicClient(mock);
 
-    await expect(classifyIntent("hello")).rejects.toThrow();
+    await expect(classifyIntent("hello")).rejects.toThrow(
+      "No tool call from Claude intent classifier"
+    );
+  });
+
+  it("forces the classify_intent tool call", async () => {
+    const mock = mockAnthropicWithToolInput({
+      intent: "research",
+      topic: "Agentic AI",
+      confidence: 0.9,
+    });
+    _setAnthropicClient(mock);
+
+    const result = await classifyIntent("What are the top skills for Agentic AI?");
+
+    expect(result).toEqual({ intent: "research", topic: "Agentic AI", confidence: 0.9 });
+    expect(mock.messages.create).toHaveBeenCalledWith(
+      expect.objectContaining({
+        tool_choice: { type: "tool", name: "classify_intent" },
+      })
+    );
   });
 });
@@ -1,9 +1,14 @@
 import Anthropic from "@anthropic-ai/sdk";
 import {
+  Intent,
   LLMIntentClassificationSchema,
   type LLMIntentClassification,
 } from "@adaptlearn/shared/types";
-import { parseJsonFromLLM } from "@adaptlearn/shared/llm-json";
+import {
+  SONNET_MODEL,
+  getAnthropicClient as getSharedAnthropicClient,
+  resolveModel,
+} from "@adaptlearn/shared/anthropic";
 
 const SYSTEM_PROMPT = `You are the intent classifier for AdaptLearn, an adaptive learning platform for banking professionals.
 
@@ -16,19 +21,33 @@ Given a user message, classify the intent into exactly one of these categories:
 
 Topics covered: Agentic AI, Salesforce Agentforce, AI Strategy (and related banking/fintech AI topics).
 
-Respond with valid JSON only — no markdown, no extra text:
-{
-  "intent": "<one of: research | create_content | assess | learn | unknown>",
-  "topic": "<extracted topic name or null if unclear>",
-  "confidence": <0.0 to 1.0>
-}`;
+Record your answer by calling the classify_intent tool:
+- "intent": one of research | create_content | assess | learn | unknown
+- "topic": the extracted topic name (omit if unclear)
+- "confidence": 0.0 to 1.0`;
+
+/**
+ * Forced tool call — Claude returns the classification as structured tool
+ * input, so there is no JSON text to strip and parse.
+ */
+const CLASSIFY_TOOL: Anthropic.Tool = {
+  name: "classify_intent",
+  description: "Record the intent classification for the user message.",
+  input_schema: {
+    type: "object",
+    properties: {
+      intent: { type: "string", enum: Intent.options },
+      topic: { type: "string", description: "Extracted topic name" },
+      confidence: { type: "number", minimum: 0, maximum: 1 },
+    },
+    required: ["intent", "confidence"],
+  },
+};
 
 let anthropicClient: Anthropic | null = null;
 
 function getAnthropicClient(): Anthropic {
-  if (anthropicClient) return anthropicClient;
-  anthropicClient = new Anthropic();
-  return anthropicClient;
+  return anthropicClient ?? getSharedAnthropicClient();
 }
 
 /**
@@ -41,19 +60,20 @@ export async function classifyIntent(
   const client = getAnthropicClient();
 
   const response = await client.messages.create({
-    model: "claude-sonnet-4-6",
-    max_tokens: 256,
+    model: resolveModel("CLASSIFIER_MODEL", SONNET_MODEL),
+    max_tokens: 128,
     system: SYSTEM_PROMPT,
+    tools: [CLASSIFY_TOOL],
+    tool_choice: { type: "tool", name: CLASSIFY_TOOL.name },
     messages: [{ role: "user", content: userMessage }],
   });
 
-  const textBlock = response.content.find((b) => b.type === "text");
-  if (!textBlock || textBlock.type !== "text") {
-    throw new Error("No text response from Claude intent classifier");
+  const toolUse = response.content.find((b) => b.type === "tool_use");
+  if (!toolUse || toolUse.type !== "tool_use") {
+    throw new Error("No tool call from Claude intent classifier");
   }
 
-  const parsed: unknown = parseJsonFromLLM(textBlock.text);
-  return LLMIntentClassificationSchema.parse(parsed);
+  return LLMIntentClassificationSchema.parse(toolUse.input);
 }
 
 /**
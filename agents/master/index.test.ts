@@ -19,6 +19,7 @@ import { handleUserMessage } from "./index.js";
 import { classifyIntent } from "./classifier.js";
 import { dispatchMessage } from "@adaptlearn/shared/bus";
 import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { _clearTopicCache } from "@adaptlearn/shared/topics";
 
 function createMockDb() {
   const mockInsert = vi.fn().mockReturnValue({ error: null });
@@ -46,6 +47,7 @@ describe("handleUserMessage", () => {
 
   beforeEach(() => {
     vi.clearAllMocks();
+    _clearTopicCache();
     mockDb = createMockDb();
     vi.mocked(getSupabaseClient).mockReturnValue(mockDb as never);
   });
@@ -211,6 +213,77 @@ describe("handleUserMessage", () => {
     expect(result.response).toContain("not sure");
   });
 
+  it("asks Scout for a refresh when the user wants the latest research", async () => {
+    vi.mocked(classifyIntent).mockResolvedValue({
+      intent: "research",
+      topic: "Agentic AI",
+      confidence: 0.95,
+    });
+    vi.mocked(dispatchMessage).mockResolvedValue({
+      id: "msg-uuid-456",
+      from_agent: "master",
+      to_agent: "scout",
+      message_type: "JobDispatch",
+      payload: {},
+      status: "pending",
+      created_at: new Date().toISOString(),
+      updated_at: new Date().toISOString(),
+    });
+
+    await handleUserMessage({
+      userId: "00000000-0000-0000-0000-000000000001",
+      message: "Refresh the research on Agentic AI",
+    });
+
+    expect(dispatchMessage).toHaveBeenCalledWith(
+      expect.objectContaining({
+        payload: expect.objectContaining({ refresh: true }),
+      })
+    );
+  });
+
+  it("does not ask for a refresh on an ordinary research question", async () => {
+    vi.mocked(classifyIntent).mockResolvedValue({
+      intent: "research",
+      topic: "Agentic AI",
+      confidence: 0.95,
+    });
+    vi.mocked(dispatchMessage).mockResolvedValue({
+      id: "msg-uuid-456",
+      from_agent: "master",
+      to_agent: "scout",
+      message_type: "JobDispatch",
+      payload: {},
+      status: "pending",
+      created_at: new Date().toISOString(),
+      updated_at: new Date().toISOString(),
+    });
+
+    await handleUserMessage({
+      userId: "00000000-0000-0000-0000-000000000001",
+      message: "What are the latest skills for Agentic AI?",
+    });
+
+    const payload = vi.mocked(dispatchMessage).mock.calls[0][0].payload;
+    expect(payload).not.toHaveProperty("refresh");
+  });
+
+  it("skips the topic lookup when nothing will be dispatched", async () => {
+    vi.mocked(classifyIntent).mockResolvedValue({
+      intent: "unknown",
+      topic: "Agentic AI",
+      confidence: 0.4,
+    });
+
+    await handleUserMessage({
+      userId: "00000000-0000-0000-0000-000000000001",
+      message: "Agentic AI?",
+    });
+
+    expect(mockDb.from).not.toHaveBeenCalledWith("topics");
+    expect(mockDb.from).toHaveBeenCalledWith("master_agent_log");
+  });
+
   it("handles missing topic gracefully", async () => {
     vi.mocked(classifyIntent).mockResolvedValue({
       intent: "research",
@@ -1,5 +1,6 @@
 import { dispatchMessage } from "@adaptlearn/shared/bus";
 import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { resolveTopicId } from "@adaptlearn/shared/topics";
 import type {
   AgentMessage,
   AgentName,
@@ -18,6 +19,14 @@ const INTENT_TO_AGENT: Record<string, AgentName> = {
   learn: "learning",
 };
 
+/**
+ * Explicit wording that asks Scout to ignore its recently saved skill map for
+ * the topic, e.g. "refresh the research on RAG". Words like "latest" are left
+ * out on purpose — "what are the latest … skills?" is an ordinary research
+ * question and should be served from the saved map.
+ */
+const REFRESH_RE = /\b(refresh|re-?research|up[- ]to[- ]date)\b/i;
+
 export interface MasterAgentInput {
   userId: string;
   message: string;
@@ -36,7 +45,7 @@ export interface MasterAgentResult {
  * Master Agent — POC v1
  *
  * 1. Classifies user intent via Claude Sonnet
- * 2. Resolves topic to a topic_id from the DB
+ * 2. Resolves topic to a topic_id from the DB (only when there is an agent to dispatch to)
  * 3. Dispatches a JobDispatch message to the right agent via Context Bus
  * 4. Logs everything to master_agent_log
  * 5. Returns a user-facing response
@@ -51,33 +60,22 @@ export async function handleUserMessage(
   const classification = await classifyIntent(input.message);
   const { intent, topic, confidence } = classification;
 
-  // Step 2: Resolve topic to topic_id (if topic was extracted)
-  let topicId: string | undefined;
-  if (topic) {
-    const { data: topicRow } = await db
-      .from("topics")
-      .select("id")
-      .ilike("name", `%${topic}%`)
-      .eq("is_active", true)
-      .limit(1)
-      .single();
-
-    if (topicRow) {
-      topicId = topicRow.id;
-    }
-  }
-
-  // Step 3: Dispatch to the target agent via Context Bus
+  // Step 2: Dispatch to the target agent via Context Bus. The topic_id is
+  // only needed for the dispatch payload, so intents with no target agent
+  // skip the lookup entirely.
   const targetAgent = INTENT_TO_AGENT[intent] ?? null;
   let agentMessageId: string | null = null;
 
   if (targetAgent) {
+    const topicId = topic ? await resolveTopicId(topic) : undefined;
+
     const payload: JobDispatchPayload = {
       intent,
       topic: topic ?? undefined,
       topic_id: topicId,
       user_id: input.userId,
       raw_input: input.message,
+      ...(intent === "research" && REFRESH_RE.test(input.message) ? { refresh: true } : {}),
     };
 
     const dispatched = await dispatchMessage({
@@ -91,10 +89,10 @@ export async function handleUserMessage(
     agentMessageId = dispatched.id;
   }
 
-  // Step 4: Build user-facing response
+  // Step 3: Build user-facing response
   const response = buildResponse(intent, topic, targetAgent);
 
-  // Step 5: Log to master_agent_log
+  // Step 4: Log to master_agent_log
   const durationMs = Date.now() - startTime;
   await db.from("master_agent_log").insert({
     user_id: input.userId,
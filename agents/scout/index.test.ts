@@ -2,6 +2,7 @@ import { describe, it, expect, vi, beforeEach } from "vitest";
 
 // Mock dependencies
 vi.mock("./research.js", () => ({
+  hasSearchProviders: vi.fn(() => true),
   researchTopic: vi.fn(),
 }));
 
@@ -17,7 +18,7 @@ vi.mock("@adaptlearn/shared/db", () => ({
 }));
 
 import { handleMessage } from "./index.js";
-import { researchTopic } from "./research.js";
+import { hasSearchProviders, researchTopic } from "./research.js";
 import {
   claimMessage,
   completeMessage,
@@ -25,6 +26,7 @@ import {
   failMessage,
 } from "@adaptlearn/shared/bus";
 import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { _clearTopicCache } from "@adaptlearn/shared/topics";
 import type { AgentMessage } from "@adaptlearn/shared/types";
 
 const TOPIC_UUID = "00000000-0000-0000-0000-000000000001";
@@ -51,20 +53,35 @@ function makeMessage(overrides: Partial<AgentMessage> = {}): AgentMessage {
 }
 
 function createMockDb() {
+  // topics: select → ilike → eq → limit → single
+  const mockTopicSingle = vi.fn().mockReturnValue({ data: null, error: null });
+  const mockTopicLimit = vi.fn().mockReturnValue({ single: mockTopicSingle });
+  const mockTopicEq = vi.fn().mockReturnValue({ limit: mockTopicLimit });
+  const mockIlike = vi.fn().mockReturnValue({ eq: mockTopicEq });
+
+  // skill_map (recent lookup): select → eq → gte → order → limit → maybeSingle
+  const mockRecentSingle = vi.fn().mockReturnValue({ data: null, error: null });
+  const mockRecentLimit = vi.fn().mockReturnValue({ maybeSingle: mockRecentSingle });
+  const mockOrder = vi.fn().mockReturnValue({ limit: mockRecentLimit });
+  const mockGte = vi.fn().mockReturnValue({ order: mockOrder });
+  const mockEqTopic = vi.fn().mockReturnValue({ gte: mockGte });
+
+  // skill_map (insert): insert → select → single
   const mockSingle = vi.fn();
-  const mockLimit = vi.fn().mockReturnValue({ single: mockSingle });
-  const mockEqActive = vi.fn().mockReturnValue({ limit: mockLimit });
-  const mockIlike = vi.fn().mockReturnValue({ eq: mockEqActive });
-  const mockSelect = vi.fn().mockImplementation(() => ({ ilike: mockIlike, single: mockSingle }));
-  const mockInsert = vi.fn().mockReturnValue({ select: mockSelect });
+  const mockInsert = vi.fn().mockReturnValue({
+    select: vi.fn().mockReturnValue({ single: mockSingle }),
+  });
 
   return {
-    from: vi.fn().mockImplementation(() => ({
-      select: mockSelect,
-      insert: mockInsert,
-    })),
+    from: vi.fn().mockImplementation((table: string) =>
+      table === "topics"
+        ? { select: vi.fn().mockReturnValue({ ilike: mockIlike }) }
+        : { select: vi.fn().mockReturnValue({ eq: mockEqTopic }), insert: mockInsert }
+    ),
     _mockSingle: mockSingle,
     _mockInsert: mockInsert,
+    _mockTopicSingle: mockTopicSingle,
+    _mockRecentSingle: mockRecentSingle,
   };
 }
 
@@ -73,6 +90,7 @@ describe("Scout Agent handleMessage", () => {
 
   beforeEach(() => {
     vi.clearAllMocks();
+    _clearTopicCache();
     mockDb = createMockDb();
     vi.mocked(getSupabaseClient).mockReturnValue(mockDb as never);
   });
@@ -130,6 +148,104 @@ describe("Scout Agent handleMessage", () => {
     expect(completeMessage).toHaveBeenCalledWith("msg-001");
   });
 
+  it("reuses a recent skill map instead of researching again", async () => {
+    vi.mocked(claimMessage).mockResolvedValue(makeMessage({ status: "processing" }));
+
+    mockDb._mockRecentSingle.mockReturnValue({
+      data: {
+        id: "skillmap-uuid-recent",
+        skills: [{ skill: "Prompt Engineering", demand_score: 0.9, level: "intermediate" }],
+        source_summary: "Cached findings.",
+      },
+      error: null,
+    });
+
+    await handleMessage(makeMessage());
+
+    expect(researchTopic).not.toHaveBeenCalled();
+    expect(mockDb._mockInsert).not.toHaveBeenCalled();
+    expect(dispatchMessage).toHaveBeenCalledWith(
+      expect.objectContaining({
+        message_type: "SkillMapReady",
+        payload: expect.objectContaining({
+          skill_map_id: "skillmap-uuid-recent",
+          skill_count: 1,
+          summary: "Cached findings.",
+        }),
+      })
+    );
+    expect(completeMessage).toHaveBeenCalledWith("msg-001");
+  });
+
+  it("researches again when the payload asks for a refresh", async () => {
+    const refreshMsg = makeMessage({
+      payload: { ...makeMessage().payload, refresh: true },
+    });
+    vi.mocked(claimMessage).mockResolvedValue({ ...refreshMsg, status: "processing" });
+    vi.mocked(researchTopic).mockResolvedValue({
+      topic: "Agentic AI",
+      skills: [{ skill: "Prompt Engineering", demand_score: 0.9, level: "intermediate" }],
+    });
+    mockDb._mockRecentSingle.mockReturnValue({
+      data: { id: "skillmap-uuid-recent", skills: [], source_summary: null },
+      error: null,
+    });
+    mockDb._mockSingle.mockReturnValue({ data: { id: "skillmap-uuid-new" }, error: null });
+
+    await handleMessage(refreshMsg);
+
+    expect(mockDb._mockRecentSingle).not.toHaveBeenCalled();
+    expect(researchTopic).toHaveBeenCalledWith("Agentic AI");
+    expect(dispatchMessage).toHaveBeenCalledWith(
+      expect.objectContaining({
+        payload: expect.objectContaining({ skill_map_id: "skillmap-uuid-new" }),
+      })
+    );
+  });
+
+  it("reports but does not save a skill map synthesized without search keys", async () => {
+    vi.mocked(claimMessage).mockResolvedValue(makeMessage({ status: "processing" }));
+    vi.mocked(hasSearchProviders).mockReturnValueOnce(false);
+    vi.mocked(researchTopic).mockResolvedValue({
+      topic: "Agentic AI",
+      skills: [{ skill: "Prompt Engineering", demand_score: 0.9, level: "intermediate" }],
+      summary: "From model knowledge.",
+    });
+
+    await handleMessage(makeMessage());
+
+    expect(mockDb._mockInsert).not.toHaveBeenCalled();
+    expect(dispatchMessage).toHaveBeenCalledWith(
+      expect.objectContaining({
+        message_type: "SkillMapReady",
+        payload: expect.objectContaining({
+          skill_map_id: null,
+          skill_count: 1,
+          summary: "From model knowledge.",
+        }),
+      })
+    );
+    expect(completeMessage).toHaveBeenCalledWith("msg-001");
+  });
+
+  it("fails the message when the recent skill map lookup errors", async () => {
+    vi.mocked(claimMessage).mockResolvedValue(makeMessage({ status: "processing" }));
+    mockDb._mockRecentSingle.mockReturnValue({
+      data: null,
+      error: { message: "connection reset" },
+    });
+
+    await expect(handleMessage(makeMessage())).rejects.toThrow(
+      "Failed to look up recent skill map: connection reset"
+    );
+
+    expect(researchTopic).not.toHaveBeenCalled();
+    expect(failMessage).toHaveBeenCalledWith(
+      "msg-001",
+      "Failed to look up recent skill map: connection reset"
+    );
+  });
+
   it("skips if message is already claimed", async () => {
     vi.mocked(claimMessage).mockResolvedValue(null);
 
@@ -161,18 +277,15 @@ describe("Scout Agent handleMessage", () => {
 
     vi.mocked(claimMessage).mockResolvedValue({ ...msgWithoutTopicId, status: "processing" });
 
-    vi.mocked(researchTopic).mockResolvedValue({
-      topic: "Unknown Topic",
-      skills: [{ skill: "Test", demand_score: 0.5, level: "beginner" }],
-    });
-
     // Topic lookup returns nothing
-    mockDb._mockSingle.mockReturnValue({ data: null, error: null });
+    mockDb._mockTopicSingle.mockReturnValue({ data: null, error: null });
 
     await expect(handleMessage(msgWithoutTopicId)).rejects.toThrow(
       'Topic not found in DB: "Unknown Topic"'
     );
 
+    expect(researchTopic).not.toHaveBeenCalled();
+
     expect(failMessage).toHaveBeenCalledWith(
       "msg-001",
       'Topic not found in DB: "Unknown Topic"'
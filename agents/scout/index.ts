@@ -5,9 +5,17 @@ import {
   failMessage,
 } from "@adaptlearn/shared/bus";
 import { getSupabaseClient } from "@adaptlearn/shared/db";
+import { resolveTopicId } from "@adaptlearn/shared/topics";
 import type { AgentMessage } from "@adaptlearn/shared/types";
 import { JobDispatchPayloadSchema } from "@adaptlearn/shared/types";
-import { researchTopic } from "./research.js";
+import { hasSearchProviders, researchTopic } from "./research.js";
+
+/**
+ * How long a saved skill map is reused before the topic is researched again.
+ * Demand for skills shifts over weeks, not hours, and each fresh run costs
+ * two paid searches plus a Claude synthesis call.
+ */
+const SKILL_MAP_TTL_MS = 24 * 60 * 60 * 1000;
 
 /**
  * Scout Agent — POC v1
@@ -17,11 +25,13 @@ import { researchTopic } from "./research.js";
  *
  * Flow:
  * 1. Claim the message (pending → processing)
- * 2. Parse the JobDispatch payload
- * 3. Run the research pipeline
- * 4. Save the skill map to the skill_map table
- * 5. Dispatch a SkillMapReady message back to the bus
- * 6. Mark the original message as done
+ * 2. Parse the JobDispatch payload and resolve topic_id
+ * 3. Reuse the topic's skill map if one was generated within SKILL_MAP_TTL_MS
+ *    (unless the payload asks for a refresh), otherwise run the research
+ *    pipeline and save the result to skill_map (not saved when no search
+ *    provider is configured)
+ * 4. Dispatch a SkillMapReady message back to the bus
+ * 5. Mark the original message as done
  */
 export async function handleMessage(msg: AgentMessage): Promise<void> {
   const claimed = await claimMessage(msg.id);
@@ -32,44 +42,13 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
     const payload = JobDispatchPayloadSchema.parse(msg.payload);
     const topic = payload.topic ?? "Agentic AI";
 
-    // Run the full research pipeline
-    const skillMapOutput = await researchTopic(topic);
-
-    // Resolve topic_id — use payload's if available, otherwise look up
-    const db = getSupabaseClient();
-    let topicId = payload.topic_id;
-
-    if (!topicId) {
-      const { data: topicRow } = await db
-        .from("topics")
-        .select("id")
-        .ilike("name", `%${topic}%`)
-        .eq("is_active", true)
-        .limit(1)
-        .single();
-
-      topicId = topicRow?.id;
-    }
-
+    const topicId = payload.topic_id ?? (await resolveTopicId(topic));
     if (!topicId) {
       throw new Error(`Topic not found in DB: "${topic}"`);
     }
 
-    // Save skill map to database
-    const { data: savedSkillMap, error: insertError } = await db
-      .from("skill_map")
-      .insert({
-        topic_id: topicId,
-        skills: skillMapOutput.skills,
-        source_summary: skillMapOutput.summary ?? null,
-        generated_at: new Date().toISOString(),
-      })
-      .select("id")
-      .single();
-
-    if (insertError) {
-      throw new Error(`Failed to save skill map: ${insertError.message}`);
-    }
+    const recent = payload.refresh ? null : await findRecentSkillMap(topicId);
+    const skillMap = recent ?? (await researchAndSave(topic, topicId));
 
     // Dispatch SkillMapReady to the bus (Content Creator and Learning Agent can pick this up)
     await dispatchMessage({
@@ -79,9 +58,9 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
       payload: {
         topic,
         topic_id: topicId,
-        skill_map_id: savedSkillMap.id,
-        skill_count: skillMapOutput.skills.length,
-        summary: skillMapOutput.summary,
+        skill_map_id: skillMap.id,
+        skill_count: skillMap.skillCount,
+        summary: skillMap.summary,
         user_id: payload.user_id,
       },
       status: "pending",
@@ -96,3 +75,76 @@ export async function handleMessage(msg: AgentMessage): Promise<void> {
     throw err;
   }
 }
+
+interface SavedSkillMap {
+  /** null when the skill map was not saved (no search providers configured) */
+  id: string | null;
+  skillCount: number;
+  summary: string | undefined;
+}
+
+/**
+ * Latest skill map for the topic, if it is still within SKILL_MAP_TTL_MS.
+ */
+async function findRecentSkillMap(topicId: string): Promise<SavedSkillMap | null> {
+  const cutoff = new Date(Date.now() - SKILL_MAP_TTL_MS).toISOString();
+
+  const { data: row, error } = await getSupabaseClient()
+    .from("skill_map")
+    .select("id, skills, source_summary")
+    .eq("topic_id", topicId)
+    .gte("generated_at", cutoff)
+    .order("generated_at", { ascending: false })
+    .limit(1)
+    .maybeSingle();
+
+  // maybeSingle() reports "no rows" as data: null, so any error here is real —
+  // fail the job rather than paying for research on a DB fault
+  if (error) {
+    throw new Error(`Failed to look up recent skill map: ${error.message}`);
+  }
+  if (!row) return null;
+
+  return {
+    id: row.id,
+    skillCount: Array.isArray(row.skills) ? row.skills.length : 0,
+    summary: row.source_summary ?? undefined,
+  };
+}
+
+/**
+ * Run the research pipeline and save the result as a new skill_map row.
+ */
+async function researchAndSave(topic: string, topicId: string): Promise<SavedSkillMap> {
+  const skillMapOutput = await researchTopic(topic);
+
+  // Without search keys the map comes from Claude alone — report it, but don't
+  // save it where it would be reused for SKILL_MAP_TTL_MS in place of research
+  if (!hasSearchProviders()) {
+    return {
+      id: null,
+      skillCount: skillMapOutput.skills.length,
+      summary: skillMapOutput.summary,
+    };
+  }
+
+  const { data: savedSkillMap, error: insertError } = await getSupabaseClient()
+    .from("skill_map")
+    .insert({
+      topic_id: topicId,
+      skills: skillMapOutput.skills,
+      source_summary: skillMapOutput.summary ?? null,
+    })
+    .select("id")
+    .single();
+
+  if (insertError) {
+    throw new Error(`Failed to save skill map: ${insertError.message}`);
+  }
+
+  return {
+    id: savedSkillMap.id,
+    skillCount: skillMapOutput.skills.length,
+    summary: skillMapOutput.summary,
+  };
+}
@@ -1,17 +1,29 @@
-import { describe, it, expect, vi, afterEach } from "vitest";
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
 import {
   searchTavily,
   searchPerplexity,
   synthesizeSkillMap,
+  researchTopic,
+  isUsableResearch,
+  searchCacheKey,
+  truncateForPrompt,
+  _clearSearchCache,
   _setAnthropicClient,
+  _setSearchRetryDelay,
 } from "./research.js";
 
 describe("searchTavily", () => {
   const originalEnv = process.env.TAVILY_API_KEY;
 
+  beforeEach(() => {
+    _setSearchRetryDelay(0);
+  });
+
   afterEach(() => {
     process.env.TAVILY_API_KEY = originalEnv;
     vi.restoreAllMocks();
+    _clearSearchCache();
+    _setSearchRetryDelay(null);
   });
 
   it("returns unavailable message when no API key", async () => {
@@ -37,6 +49,23 @@ describe("searchTavily", () => {
     expect(result).toContain("Source 1");
   });
 
+  it("drops results that repeat a URL", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    vi.spyOn(globalThis, "fetch").mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        results: [
+          { title: "Page A", content: "First chunk", url: "https://example.com/a" },
+          { title: "Page A", content: "Second chunk", url: "https://example.com/a" },
+          { title: "Page B", content: "Other page", url: "https://example.com/b" },
+        ],
+      }),
+    } as Response);
+
+    const result = await searchTavily("agent orchestration");
+    expect(result).toBe("- Page A: First chunk\n- Page B: Other page");
+  });
+
   it("returns error message on API failure", async () => {
     process.env.TAVILY_API_KEY = "test-key";
     vi.spyOn(globalThis, "fetch").mockResolvedValue({
@@ -47,14 +76,113 @@ describe("searchTavily", () => {
     const result = await searchTavily("test");
     expect(result).toBe("[Tavily error: 500]");
   });
+
+  it("serves a repeated query from cache", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    const fetchSpy = vi.spyOn(globalThis, "fetch").mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        results: [{ title: "Source 1", content: "Cached content", url: "https://example.com" }],
+      }),
+    } as Response);
+
+    const first = await searchTavily("agentic AI banking skills");
+    const second = await searchTavily("agentic AI banking skills");
+
+    expect(second).toBe(first);
+    expect(fetchSpy).toHaveBeenCalledTimes(1);
+  });
+
+  it("shares one request between concurrent identical queries", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    const fetchSpy = vi.spyOn(globalThis, "fetch").mockResolvedValue({
+      ok: true,
+      json: async () => ({
+        results: [{ title: "Source 1", content: "Shared content", url: "https://example.com" }],
+      }),
+    } as Response);
+
+    const [first, second] = await Promise.all([
+      searchTavily("agentic AI banking skills"),
+      searchTavily("Agentic AI banking skills?"),
+    ]);
+
+    expect(second).toBe(first);
+    expect(fetchSpy).toHaveBeenCalledTimes(1);
+  });
+
+  it("does not cache failed searches", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    const fetchSpy = vi.spyOn(globalThis, "fetch").mockResolvedValue({
+      ok: false,
+      status: 503,
+    } as Response);
+
+    await searchTavily("test");
+    await searchTavily("test");
+
+    // One initial attempt plus one retry per call
+    expect(fetchSpy).toHaveBeenCalledTimes(4);
+  });
+
+  it("retries once on a transient 5xx", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    const fetchSpy = vi
+      .spyOn(globalThis, "fetch")
+      .mockResolvedValueOnce({ ok: false, status: 502 } as Response)
+      .mockResolvedValueOnce({
+        ok: true,
+        json: async () => ({ answer: "Recovered." }),
+      } as Response);
+
+    const result = await searchTavily("agent evaluation");
+
+    expect(result).toContain("Recovered.");
+    expect(fetchSpy).toHaveBeenCalledTimes(2);
+  });
+
+  it("cancels the dropped response body before retrying", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    const cancel = vi.fn().mockResolvedValue(undefined);
+    vi.spyOn(globalThis, "fetch")
+      .mockResolvedValueOnce({ ok: false, status: 503, body: { cancel } } as unknown as Response)
+      .mockResolvedValueOnce({
+        ok: true,
+        json: async () => ({ answer: "Recovered." }),
+      } as Response);
+
+    await searchTavily("agent evaluation");
+
+    expect(cancel).toHaveBeenCalledOnce();
+  });
+
+  it("stops calling Tavily after repeated failures", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    const fetchSpy = vi.spyOn(globalThis, "fetch").mockRejectedValue(new Error("fetch failed"));
+
+    for (const query of ["q1", "q2", "q3"]) {
+      await expect(searchTavily(query)).rejects.toThrow("fetch failed");
+    }
+
+    const result = await searchTavily("q4");
+
+    expect(result).toBe("[Tavily unavailable — too many recent failures]");
+    expect(fetchSpy).toHaveBeenCalledTimes(3);
+  });
 });
 
 describe("searchPerplexity", () => {
   const originalEnv = process.env.PERPLEXITY_API_KEY;
 
+  beforeEach(() => {
+    _setSearchRetryDelay(0);
+  });
+
   afterEach(() => {
     process.env.PERPLEXITY_API_KEY = originalEnv;
     vi.restoreAllMocks();
+    _clearSearchCache();
+    _setSearchRetryDelay(null);
   });
 
   it("returns unavailable message when no API key", async () => {
@@ -149,3 +277,125 @@ describe("synthesizeSkillMap", () => {
     );
   });
 });
+
+describe("truncateForPrompt", () => {
+  it("returns short text unchanged", () => {
+    expect(truncateForPrompt("short text", 100)).toBe("short text");
+  });
+
+  it("cuts long text and marks the truncation", () => {
+    const result = truncateForPrompt("a".repeat(50), 10);
+    expect(result).toBe(`${"a".repeat(10)}\n...[truncated]`);
+  });
+});
+
+describe("searchCacheKey", () => {
+  it("ignores case, repeated whitespace and trailing punctuation", () => {
+    expect(searchCacheKey("tavily", "  Agentic AI   skills? ")).toBe(
+      searchCacheKey("tavily", "agentic ai skills")
+    );
+  });
+
+  it("keeps sources separate", () => {
+    expect(searchCacheKey("tavily", "rag")).not.toBe(searchCacheKey("perplexity", "rag"));
+  });
+});
+
+describe("researchTopic", () => {
+  const originalTavily = process.env.TAVILY_API_KEY;
+  const originalPerplexity = process.env.PERPLEXITY_API_KEY;
+
+  afterEach(() => {
+    process.env.TAVILY_API_KEY = originalTavily;
+    process.env.PERPLEXITY_API_KEY = originalPerplexity;
+    vi.restoreAllMocks();
+    _clearSearchCache();
+    _setAnthropicClient(null);
+  });
+
+  it("still synthesizes when one search provider fails", async () => {
+    process.env.TAVILY_API_KEY = "test-key";
+    process.env.PERPLEXITY_API_KEY = "test-key";
+    vi.spyOn(globalThis, "fetch").mockImplementation(async (input) => {
+      if (String(input).includes("tavily")) {
+        throw new Error("fetch failed");
+      }
+      return {
+        ok: true,
+        json: async () => ({
+          choices: [{ message: { content: "Prompt engineering is in demand." } }],
+        }),
+      } as Response;
+    });
+
+    const create = vi.fn().mockResolvedValue({
+      content: [
+        {
+          type: "text",
+          text: JSON.stringify({
+            topic: "Agentic AI",
+            skills: [{ skill: "Prompt Engineering", demand_score: 0.9, level: "beginner" }],
+          }),
+        },
+      ],
+    });
+    _setAnthropicClient({ messages: { create } } as unknown as import("@anthropic-ai/sdk").default);
+
+    const result = await researchTopic("Agentic AI");
+
+    expect(result.skills[0].skill).toBe("Prompt Engineering");
+    const prompt = create.mock.calls[0][0].messages[0].content as string;
+    expect(prompt).toContain("[Tavily error: fetch failed]");
+    expect(prompt).toContain("Prompt engineering is in demand.");
+  });
+
+  it("synthesizes from Claude alone when no search keys are configured", async () => {
+    delete process.env.TAVILY_API_KEY;
+    delete process.env.PERPLEXITY_API_KEY;
+    const fetchSpy = vi.spyOn(globalThis, "fetch");
+
+    const create = vi.fn().mockResolvedValue({
+      content: [
+        {
+          type: "text",
+          text: JSON.stringify({
+            topic: "Agentic AI",
+            skills: [{ skill: "Prompt Engineering", demand_score: 0.9, level: "beginner" }],
+          }),
+        },
+      ],
+    });
+    _setAnthropicClient({ messages: { create } } as unknown as import("@anthropic-ai/sdk").default);
+
+    const result = await researchTopic("Agentic AI");
+
+    expect(result.skills[0].skill).toBe("Prompt Engineering");
+    expect(fetchSpy).not.toHaveBeenCalled();
+  });
+
+  it("refuses to synthesize when no source returned usable research", async () => {
+    delete process.env.TAVILY_API_KEY;
+    process.env.PERPLEXITY_API_KEY = "test-key";
+    vi.spyOn(globalThis, "fetch").mockResolvedValue({ ok: false, status: 400 } as Response);
+
+    const create = vi.fn();
+    _setAnthropicClient({ messages: { create } } as unknown as import("@anthropic-ai/sdk").default);
+
+    await expect(researchTopic("Agentic AI")).rejects.toThrow(
+      'All research sources failed for topic: "Agentic AI"'
+    );
+    expect(create).not.toHaveBeenCalled();
+  });
+});
+
+describe("isUsableResearch", () => {
+  it("rejects the clients' bracketed markers", () => {
+    expect(isUsableResearch("[Tavily error: 503]")).toBe(false);
+    expect(isUsableResearch("[Perplexity unavailable — too many recent failures]")).toBe(false);
+    expect(isUsableResearch("[No results]")).toBe(false);
+  });
+
+  it("accepts research text", () => {
+    expect(isUsableResearch("Answer: RAG is in demand.\n\nSources:\n- [1] Report")).toBe(true);
+  });
+});
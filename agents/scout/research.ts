@@ -4,6 +4,152 @@ import {
   type LLMSkillMapOutput,
 } from "@adaptlearn/shared/types";
 import { parseJsonFromLLM } from "@adaptlearn/shared/llm-json";
+import {
+  HAIKU_MODEL,
+  getAnthropicClient as getSharedAnthropicClient,
+  resolveModel,
+} from "@adaptlearn/shared/anthropic";
+
+// ─── Search Cache ───────────────────────────────────────────────────────────
+
+/**
+ * How long a search result is reused for an identical query. Scout's queries
+ * are built from the topic name, so repeat research on a topic is common and
+ * the web rarely changes meaningfully within a few minutes.
+ */
+const SEARCH_CACHE_TTL_MS = 10 * 60 * 1000;
+const SEARCH_CACHE_MAX_ENTRIES = 200;
+
+const searchCache = new Map<string, { text: string; expiresAt: number }>();
+
+/**
+ * A search outcome. Only successful responses are cached — errors and empty
+ * responses are retried on the next call.
+ */
+interface SearchOutcome {
+  text: string;
+  cacheable: boolean;
+}
+
+/**
+ * Cache key for a query. Case, runs of whitespace and trailing punctuation
+ * don't change what the providers return, so "Agentic AI skills?" and
+ * "agentic  ai skills" share an entry.
+ */
+export function searchCacheKey(source: string, query: string): string {
+  const normalized = query
+    .toLowerCase()
+    .replace(/\s+/g, " ")
+    .trim()
+    .replace(/[?.!,;:]+$/, "");
+  return `${source}:${normalized}`;
+}
+
+/**
+ * Searches currently on the wire, by cache key. Concurrent Scout jobs for the
+ * same topic share one request instead of each paying for their own.
+ */
+const inFlightSearches = new Map<string, Promise<string>>();
+
+async function withSearchCache(
+  key: string,
+  search: () => Promise<SearchOutcome>
+): Promise<string> {
+  const hit = searchCache.get(key);
+  if (hit && hit.expiresAt > Date.now()) {
+    return hit.text;
+  }
+  searchCache.delete(key);
+
+  const pending = inFlightSearches.get(key);
+  if (pending) return pending;
+
+  const request = (async () => {
+    try {
+      const { text, cacheable } = await search();
+      if (cacheable) {
+        // Map iteration is insertion order, so the first key is the oldest entry
+        if (searchCache.size >= SEARCH_CACHE_MAX_ENTRIES) {
+          const oldest = searchCache.keys().next().value;
+          if (oldest !== undefined) searchCache.delete(oldest);
+        }
+        searchCache.set(key, { text, expiresAt: Date.now() + SEARCH_CACHE_TTL_MS });
+      }
+      return text;
+    } finally {
+      inFlightSearches.delete(key);
+    }
+  })();
+
+  inFlightSearches.set(key, request);
+  return request;
+}
+
+// ─── Retry + Circuit Breaker ────────────────────────────────────────────────
+
+/** Consecutive failures after which a provider is skipped for a cooldown. */
+const BREAKER_FAILURE_THRESHOLD = 3;
+const BREAKER_COOLDOWN_MS = 30 * 1000;
+
+/** Base delay before the single retry of a 429/5xx; jitter adds up to 100%. */
+const SEARCH_RETRY_BASE_MS = 200;
+let searchRetryBaseMs = SEARCH_RETRY_BASE_MS;
+
+const breakers = new Map<string, { failures: number; openedAt: number }>();
+
+function isRetryableStatus(status: number): boolean {
+  return status === 429 || status >= 500;
+}
+
+/**
+ * True while a provider's breaker is open. Once the cooldown has passed the
+ * next call is let through as a trial; another failure re-opens it.
+ */
+function isCircuitOpen(source: string): boolean {
+  const breaker = breakers.get(source);
+  return (
+    breaker !== undefined &&
+    breaker.failures >= BREAKER_FAILURE_THRESHOLD &&
+    Date.now() - breaker.openedAt < BREAKER_COOLDOWN_MS
+  );
+}
+
+function recordOutcome(source: string, failed: boolean): void {
+  if (!failed) {
+    breakers.delete(source);
+    return;
+  }
+  const breaker = breakers.get(source) ?? { failures: 0, openedAt: 0 };
+  breaker.failures++;
+  if (breaker.failures >= BREAKER_FAILURE_THRESHOLD) {
+    breaker.openedAt = Date.now();
+  }
+  breakers.set(source, breaker);
+}
+
+/**
+ * fetch() with one jittered retry on 429/5xx, feeding the provider's breaker.
+ * Network errors count as failures and are rethrown to the caller.
+ */
+async function fetchSearch(source: string, url: string, init: RequestInit): Promise<Response> {
+  let res: Response;
+  try {
+    res = await fetch(url, init);
+    if (isRetryableStatus(res.status)) {
+      // Release the dropped response's connection before retrying
+      await res.body?.cancel();
+      const delayMs = searchRetryBaseMs * (1 + Math.random());
+      await new Promise((resolve) => setTimeout(resolve, delayMs));
+      res = await fetch(url, init);
+    }
+  } catch (err) {
+    recordOutcome(source, true);
+    throw err;
+  }
+
+  recordOutcome(source, isRetryableStatus(res.status));
+  return res;
+}
 
 // ─── External API Clients ───────────────────────────────────────────────────
 
@@ -17,34 +163,46 @@ export async function searchTavily(query: string): Promise<string> {
     return "[Tavily unavailable — no API key]";
   }
 
-  const res = await fetch("https://api.tavily.com/search", {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify({
-      api_key: apiKey,
-      query,
-      search_depth: "advanced",
-      max_results: 5,
-      include_answer: true,
-    }),
-  });
+  return withSearchCache(searchCacheKey("tavily", query), async () => {
+    if (isCircuitOpen("tavily")) {
+      return { text: "[Tavily unavailable — too many recent failures]", cacheable: false };
+    }
 
-  if (!res.ok) {
-    return `[Tavily error: ${res.status}]`;
-  }
+    const res = await fetchSearch("tavily", "https://api.tavily.com/search", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        api_key: apiKey,
+        query,
+        search_depth: "advanced",
+        max_results: 5,
+        include_answer: true,
+      }),
+    });
+
+    if (!res.ok) {
+      return { text: `[Tavily error: ${res.status}]`, cacheable: false };
+    }
 
-  const data = (await res.json()) as {
-    answer?: string;
-    results?: Array<{ title: string; content: string; url: string }>;
-  };
+    const data = (await res.json()) as {
+      answer?: string;
+      results?: Array<{ title: string; content: string; url: string }>;
+    };
 
-  const snippets = (data.results ?? [])
-    .map((r) => `- ${r.title}: ${r.content}`)
-    .join("\n");
+    // Tavily can return several chunks of the same page — keep the first per URL
+    const seenUrls = new Set<string>();
+    const snippets = (data.results ?? [])
+      .filter((r) => !seenUrls.has(r.url) && seenUrls.add(r.url))
+      .map((r) => `- ${r.title}: ${r.content}`)
+      .join("\n");
 
-  return data.answer
-    ? `Answer: ${data.answer}\n\nSources:\n${snippets}`
-    : snippets || "[No results]";
+    if (data.answer) {
+      return { text: `Answer: ${data.answer}\n\nSources:\n${snippets}`, cacheable: true };
+    }
+    return snippets
+      ? { text: snippets, cacheable: true }
+      : { text: "[No results]", cacheable: false };
+  });
 }
 
 /**
@@ -57,33 +215,42 @@ export async function searchPerplexity(query: string): Promise<string> {
     return "[Perplexity unavailable — no API key]";
   }
 
-  const res = await fetch("https://api.perplexity.ai/chat/completions", {
-    method: "POST",
-    headers: {
-      "Content-Type": "application/json",
-      Authorization: `Bearer ${apiKey}`,
-    },
-    body: JSON.stringify({
-      model: "sonar",
-      messages: [
-        {
-          role: "user",
-          content: query,
-        },
-      ],
-      max_tokens: 1024,
-    }),
-  });
+  return withSearchCache(searchCacheKey("perplexity", query), async () => {
+    if (isCircuitOpen("perplexity")) {
+      return { text: "[Perplexity unavailable — too many recent failures]", cacheable: false };
+    }
 
-  if (!res.ok) {
-    return `[Perplexity error: ${res.status}]`;
-  }
+    const res = await fetchSearch("perplexity", "https://api.perplexity.ai/chat/completions", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${apiKey}`,
+      },
+      body: JSON.stringify({
+        model: "sonar",
+        messages: [
+          {
+            role: "user",
+            content: query,
+          },
+        ],
+        max_tokens: 1024,
+      }),
+    });
+
+    if (!res.ok) {
+      return { text: `[Perplexity error: ${res.status}]`, cacheable: false };
+    }
 
-  const data = (await res.json()) as {
-    choices?: Array<{ message?: { content?: string } }>;
-  };
+    const data = (await res.json()) as {
+      choices?: Array<{ message?: { content?: string } }>;
+    };
 
-  return data.choices?.[0]?.message?.content ?? "[No Perplexity response]";
+    const content = data.choices?.[0]?.message?.content;
+    return content
+      ? { text: content, cacheable: true }
+      : { text: "[No Perplexity response]", cacheable: false };
+  });
 }
 
 // ─── Claude Synthesis ───────────────────────────────────────────────────────
@@ -91,9 +258,7 @@ export async function searchPerplexity(query: string): Promise<string> {
 let anthropicClient: Anthropic | null = null;
 
 function getAnthropicClient(): Anthropic {
-  if (anthropicClient) return anthropicClient;
-  anthropicClient = new Anthropic();
-  return anthropicClient;
+  return anthropicClient ?? getSharedAnthropicClient();
 }
 
 const SYNTHESIS_PROMPT = `You are the Scout Agent for AdaptLearn, an adaptive learning platform for banking professionals.
@@ -105,7 +270,7 @@ For each skill:
 - "demand_score": 0.0 to 1.0 reflecting how in-demand this skill is
 - "level": "beginner", "intermediate", or "advanced"
 
-Respond with valid JSON only — no markdown, no extra text:
+Respond with valid JSON only — no markdown, no extra text. Emit compact single-line JSON (the shape below is indented only for readability):
 {
   "topic": "<topic name>",
   "skills": [
@@ -125,7 +290,7 @@ export async function synthesizeSkillMap(
   const client = getAnthropicClient();
 
   const response = await client.messages.create({
-    model: "claude-haiku-4-5-20251001",
+    model: resolveModel("SYNTHESIS_MODEL", HAIKU_MODEL),
     max_tokens: 1024,
     system: SYNTHESIS_PROMPT,
     messages: [
@@ -145,30 +310,112 @@ export async function synthesizeSkillMap(
   return LLMSkillMapOutputSchema.parse(parsed);
 }
 
+/**
+ * Per-source character budget for the research data sent to Claude.
+ * Keeps synthesis input tokens bounded when a search returns long pages.
+ */
+export const MAX_SOURCE_CHARS = 6000;
+
+/**
+ * Truncate text to at most maxChars, marking the cut so the model knows
+ * the source was shortened.
+ */
+export function truncateForPrompt(text: string, maxChars: number): string {
+  if (text.length <= maxChars) return text;
+  return `${text.slice(0, maxChars)}\n...[truncated]`;
+}
+
+/**
+ * Text for a settled search — the result, or an error marker in the same
+ * "[Source error: ...]" form the search clients return for HTTP failures.
+ */
+function settledText(result: PromiseSettledResult<string>, source: string): string {
+  if (result.status === "fulfilled") return result.value;
+  const reason = result.reason instanceof Error ? result.reason.message : "unknown";
+  return `[${source} error: ${reason}]`;
+}
+
+/**
+ * True when at least one search provider has an API key. With none, Scout
+ * synthesizes from Claude's own knowledge, ungrounded by any search results.
+ */
+export function hasSearchProviders(): boolean {
+  return Boolean(process.env.TAVILY_API_KEY || process.env.PERPLEXITY_API_KEY);
+}
+
+/**
+ * Every non-result the search clients return is a single bracketed marker —
+ * "[Tavily error: 503]", "[No results]", "[Perplexity unavailable — ...]".
+ */
+const SEARCH_MARKER_RE = /^\[[^\]]*\]$/;
+
+/**
+ * Whether a search returned actual research text rather than a marker.
+ */
+export function isUsableResearch(text: string): boolean {
+  return !SEARCH_MARKER_RE.test(text.trim());
+}
+
 /**
  * Full research pipeline: Tavily + Perplexity → Claude synthesis → SkillMap
+ *
+ * Throws when neither source returned usable text, so a skill map is never
+ * synthesized (and saved) without research behind it.
  */
 export async function researchTopic(topic: string): Promise<LLMSkillMapOutput> {
-  // Run Tavily and Perplexity searches in parallel
-  const [tavilyResults, perplexityResults] = await Promise.all([
+  // Run Tavily and Perplexity searches in parallel. A network failure in one
+  // provider shouldn't sink the job — synthesis can work from the other.
+  const [tavily, perplexity] = await Promise.allSettled([
     searchTavily(`${topic} skills in demand for banking professionals 2026`),
     searchPerplexity(
       `What are the most important ${topic} skills for banking and financial services professionals in 2026?`
     ),
   ]);
 
+  const tavilyText = settledText(tavily, "Tavily");
+  const perplexityText = settledText(perplexity, "Perplexity");
+
+  // A keyless deployment has nothing to fail and synthesizes as it always has;
+  // otherwise a configured source must have returned real results
+  if (
+    hasSearchProviders() &&
+    !isUsableResearch(tavilyText) &&
+    !isUsableResearch(perplexityText)
+  ) {
+    throw new Error(
+      `All research sources failed for topic: "${topic}" (${tavilyText} ${perplexityText})`
+    );
+  }
+
   const combinedResearch = [
     "=== Web Search (Tavily) ===",
-    tavilyResults,
+    truncateForPrompt(tavilyText, MAX_SOURCE_CHARS),
     "",
     "=== AI Research (Perplexity) ===",
-    perplexityResults,
+    truncateForPrompt(perplexityText, MAX_SOURCE_CHARS),
   ].join("\n");
 
   // Synthesize into a structured skill map
   return synthesizeSkillMap(topic, combinedResearch);
 }
 
+/**
+ * Drop all cached search state — results, in-flight requests and circuit
+ * breakers. Exposed for tests.
+ */
+export function _clearSearchCache(): void {
+  searchCache.clear();
+  inFlightSearches.clear();
+  breakers.clear();
+}
+
+/**
+ * Overridable for testing — sets the base retry delay (null restores the default).
+ */
+export function _setSearchRetryDelay(ms: number | null): void {
+  searchRetryBaseMs = ms ?? SEARCH_RETRY_BASE_MS;
+}
+
 /**
  * Overridable for testing — allows injecting a mock Anthropic client.
  */
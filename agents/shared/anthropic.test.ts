@@ -0,0 +1,57 @@
+import { describe, it, expect, afterEach } from "vitest";
+import {
+  DEFAULT_MAX_RETRIES,
+  SONNET_MODEL,
+  getAnthropicClient,
+  resolveModel,
+} from "./anthropic.js";
+
+describe("getAnthropicClient", () => {
+  const originalKey = process.env.ANTHROPIC_API_KEY;
+
+  afterEach(() => {
+    if (originalKey === undefined) {
+      delete process.env.ANTHROPIC_API_KEY;
+    } else {
+      process.env.ANTHROPIC_API_KEY = originalKey;
+    }
+  });
+
+  it("reuses the same client for the same API key", () => {
+    process.env.ANTHROPIC_API_KEY = "test-key-1";
+
+    expect(getAnthropicClient()).toBe(getAnthropicClient());
+  });
+
+  it("builds a separate client when the API key changes", () => {
+    process.env.ANTHROPIC_API_KEY = "test-key-1";
+    const first = getAnthropicClient();
+
+    process.env.ANTHROPIC_API_KEY = "test-key-2";
+    const second = getAnthropicClient();
+
+    expect(second).not.toBe(first);
+    expect(second.apiKey).toBe("test-key-2");
+  });
+
+  it("retries transient errors with the default budget", () => {
+    process.env.ANTHROPIC_API_KEY = "test-key-retries";
+
+    expect(getAnthropicClient().maxRetries).toBe(DEFAULT_MAX_RETRIES);
+  });
+});
+
+describe("resolveModel", () => {
+  afterEach(() => {
+    delete process.env.TEST_STAGE_MODEL;
+  });
+
+  it("falls back to the default model when no override is set", () => {
+    expect(resolveModel("TEST_STAGE_MODEL", SONNET_MODEL)).toBe(SONNET_MODEL);
+  });
+
+  it("uses the env override when set", () => {
+    process.env.TEST_STAGE_MODEL = "claude-haiku-4-5-20251001";
+    expect(resolveModel("TEST_STAGE_MODEL", SONNET_MODEL)).toBe("claude-haiku-4-5-20251001");
+  });
+});
@@ -0,0 +1,49 @@
+import Anthropic from "@anthropic-ai/sdk";
+
+/**
+ * Default models (see CLAUDE.md): Sonnet for intent classification and lesson
+ * generation, Haiku for lighter extraction and scoring work.
+ */
+export const SONNET_MODEL = "claude-sonnet-4-6";
+export const HAIKU_MODEL = "claude-haiku-4-5-20251001";
+
+/**
+ * Retries for transient 408/409/429/5xx errors. The SDK backs off
+ * exponentially with jitter and honours Retry-After, so a rate-limit blip
+ * costs a short wait instead of failing the whole agent job.
+ */
+export const DEFAULT_MAX_RETRIES = 4;
+
+const clients = new Map<string, Anthropic>();
+
+function resolveMaxRetries(): number {
+  const parsed = Number.parseInt(process.env.ANTHROPIC_MAX_RETRIES ?? "", 10);
+  return Number.isNaN(parsed) || parsed < 0 ? DEFAULT_MAX_RETRIES : parsed;
+}
+
+/**
+ * Returns the Anthropic client for the configured API key.
+ * Reuses the same instance (and its HTTP connection pool) across all agent calls
+ * within a process, instead of each agent module building its own.
+ */
+export function getAnthropicClient(): Anthropic {
+  const apiKey = process.env.ANTHROPIC_API_KEY;
+  const cacheKey = apiKey ?? "";
+
+  let client = clients.get(cacheKey);
+  if (!client) {
+    client = new Anthropic({ apiKey, maxRetries: resolveMaxRetries() });
+    clients.set(cacheKey, client);
+  }
+
+  return client;
+}
+
+/**
+ * Resolve the model for an agent stage. An env override lets a stage be
+ * routed to a smaller, faster model (e.g. CLASSIFIER_MODEL=claude-haiku-...)
+ * without a code change.
+ */
+export function resolveModel(envVar: string, fallback: string): string {
+  return process.env[envVar] || fallback;
+}
@@ -0,0 +1,44 @@
+import { describe, it, expect } from "vitest";
+import { mapWithConcurrency } from "./concurrency.js";
+
+function delay(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+describe("mapWithConcurrency", () => {
+  it("returns results in input order", async () => {
+    const result = await mapWithConcurrency([30, 10, 20], 3, async (ms) => {
+      await delay(ms);
+      return ms * 2;
+    });
+
+    expect(result).toEqual([60, 20, 40]);
+  });
+
+  it("never exceeds the concurrency limit", async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+
+    await mapWithConcurrency([1, 2, 3, 4, 5, 6], 2, async () => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await delay(5);
+      inFlight--;
+    });
+
+    expect(maxInFlight).toBe(2);
+  });
+
+  it("handles an empty list", async () => {
+    expect(await mapWithConcurrency([], 4, async (x: number) => x)).toEqual([]);
+  });
+
+  it("rejects when any call fails", async () => {
+    await expect(
+      mapWithConcurrency([1, 2, 3], 2, async (x) => {
+        if (x === 2) throw new Error("write failed");
+        return x;
+      })
+    ).rejects.toThrow("write failed");
+  });
+});
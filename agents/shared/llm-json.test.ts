@@ -0,0 +1,31 @@
+import { describe, it, expect } from "vitest";
+import { parseJsonFromLLM } from "./llm-json.js";
+
+describe("parseJsonFromLLM", () => {
+  it("parses plain JSON", () => {
+    expect(parseJsonFromLLM('{"intent":"research"}')).toEqual({ intent: "research" });
+  });
+
+  it("strips ```json fences", () => {
+    expect(parseJsonFromLLM('```json\n{"intent":"learn"}\n```')).toEqual({
+      intent: "learn",
+    });
+  });
+
+  it("strips bare ``` fences and surrounding whitespace", () => {
+    expect(parseJsonFromLLM('  \n```\n[1, 2, 3]\n```  \n')).toEqual([1, 2, 3]);
+  });
+
+  it("parses consecutive fenced responses independently", () => {
+    expect(parseJsonFromLLM('```json\n{"a":1}\n```')).toEqual({ a: 1 });
+    expect(parseJsonFromLLM('```json\n{"b":2}\n```')).toEqual({ b: 2 });
+  });
+
+  it("leaves JSON containing backticks inside strings untouched", () => {
+    expect(parseJsonFromLLM('{"code":"```js```"}')).toEqual({ code: "```js```" });
+  });
+
+  it("throws on invalid JSON", () => {
+    expect(() => parseJsonFromLLM("not json at all")).toThrow();
+  });
+});
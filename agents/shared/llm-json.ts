@@ -1,3 +1,6 @@
+// Matches a whole response wrapped in ```json ... ``` or ``` ... ``` fences
+const FENCE_RE = /^```(?:json)?\s*\n?([\s\S]*?)\n?\s*```$/;
+
 /**
  * Strip markdown code fences from LLM output before JSON parsing.
  *
@@ -7,10 +10,12 @@
 export function parseJsonFromLLM(raw: string): unknown {
   let cleaned = raw.trim();
 
-  // Strip ```json ... ``` or ``` ... ``` fences
-  const fenceMatch = cleaned.match(/^```(?:json)?\s*\n?([\s\S]*?)\n?\s*```$/);
-  if (fenceMatch) {
-    cleaned = fenceMatch[1].trim();
+  // Most responses are bare JSON — only run the regex when a fence is present
+  if (cleaned.startsWith("```")) {
+    const fenceMatch = FENCE_RE.exec(cleaned);
+    if (fenceMatch) {
+      cleaned = fenceMatch[1].trim();
+    }
   }
 
   return JSON.parse(cleaned);
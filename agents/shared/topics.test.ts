@@ -0,0 +1,62 @@
+import { describe, it, expect, vi, beforeEach } from "vitest";
+
+vi.mock("./db.js", () => ({
+  getSupabaseClient: vi.fn(),
+}));
+
+import { resolveTopicId, _clearTopicCache } from "./topics.js";
+import { getSupabaseClient } from "./db.js";
+
+const TOPIC_UUID = "00000000-0000-0000-0000-000000000001";
+
+function createMockDb(row: { id: string } | null) {
+  const mockSingle = vi.fn().mockReturnValue({ data: row, error: null });
+  const mockLimit = vi.fn().mockReturnValue({ single: mockSingle });
+  const mockEq = vi.fn().mockReturnValue({ limit: mockLimit });
+  const mockIlike = vi.fn().mockReturnValue({ eq: mockEq });
+  const mockSelect = vi.fn().mockReturnValue({ ilike: mockIlike });
+
+  return {
+    from: vi.fn().mockReturnValue({ select: mockSelect }),
+    _mockSingle: mockSingle,
+  };
+}
+
+describe("resolveTopicId", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    _clearTopicCache();
+  });
+
+  it("looks up the topic once and serves repeats from cache", async () => {
+    const mockDb = createMockDb({ id: TOPIC_UUID });
+    vi.mocked(getSupabaseClient).mockReturnValue(mockDb as never);
+
+    expect(await resolveTopicId("Agentic AI")).toBe(TOPIC_UUID);
+    expect(await resolveTopicId("Agentic AI")).toBe(TOPIC_UUID);
+
+    expect(mockDb.from).toHaveBeenCalledTimes(1);
+    expect(mockDb.from).toHaveBeenCalledWith("topics");
+  });
+
+  it("shares one cache entry across casing and surrounding whitespace", async () => {
+    const mockDb = createMockDb({ id: TOPIC_UUID });
+    vi.mocked(getSupabaseClient).mockReturnValue(mockDb as never);
+
+    expect(await resolveTopicId("Agentic AI")).toBe(TOPIC_UUID);
+    expect(await resolveTopicId("  agentic ai ")).toBe(TOPIC_UUID);
+
+    expect(mockDb.from).toHaveBeenCalledTimes(1);
+  });
+
+  it("does not cache a missing topic", async () => {
+    const mockDb = createMockDb(null);
+    vi.mocked(getSupabaseClient).mockReturnValue(mockDb as never);
+
+    expect(await resolveTopicId("Unknown")).toBeUndefined();
+
+    mockDb._mockSingle.mockReturnValue({ data: { id: TOPIC_UUID }, error: null });
+    expect(await resolveTopicId("Unknown")).toBe(TOPIC_UUID);
+    expect(mockDb.from).toHaveBeenCalledTimes(2);
+  });
+});
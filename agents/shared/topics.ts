@@ -0,0 +1,52 @@
+import { getSupabaseClient } from "./db.js";
+
+/**
+ * How long a resolved topic_id is reused before hitting the topics table again.
+ * Topics are seeded by migrations and rarely change, so a few minutes is safe.
+ */
+const TOPIC_ID_TTL_MS = 5 * 60 * 1000;
+
+const topicIds = new Map<string, { id: string; expiresAt: number }>();
+
+/**
+ * Resolve a topic name to the id of a matching active topic.
+ *
+ * Every agent that receives a bare topic name runs this lookup, often for the
+ * same handful of topics, so hits are cached in-process. Misses are not cached,
+ * so a newly seeded topic is picked up on the next call.
+ */
+export async function resolveTopicId(topic: string): Promise<string | undefined> {
+  // ilike matching is case-insensitive, so "agentic ai" and "Agentic AI "
+  // resolve to the same row — lowercase once and share one cache entry
+  const name = topic.trim();
+  const key = name.toLowerCase();
+
+  const cached = topicIds.get(key);
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.id;
+  }
+
+  const { data: topicRow } = await getSupabaseClient()
+    .from("topics")
+    .select("id")
+    .ilike("name", `%${name}%`)
+    .eq("is_active", true)
+    .limit(1)
+    .single();
+
+  const id: string | undefined = topicRow?.id;
+  if (id) {
+    topicIds.set(key, { id, expiresAt: Date.now() + TOPIC_ID_TTL_MS });
+  } else {
+    topicIds.delete(key);
+  }
+
+  return id;
+}
+
+/**
+ * Drop all cached topic ids. Exposed for tests.
+ */
+export function _clearTopicCache(): void {
+  topicIds.clear();
+}
@@ -220,6 +220,8 @@ export const JobDispatchPayloadSchema = z.object({
   depth: Depth.optional(),
   content_item_id: z.string().uuid().optional(),
   raw_input: z.string(),
+  // Scout: skip any recently saved skill map and research the topic afresh
+  refresh: z.boolean().optional(),
 });
 export type JobDispatchPayload = z.infer<typeof JobDispatchPayloadSchema>;
 
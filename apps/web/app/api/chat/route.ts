@@ -1,9 +1,12 @@
 import { NextRequest, NextResponse } from "next/server";
 import { z } from "zod";
-import { handleUserMessage } from "@adaptlearn/agent-master";
+import { MAX_MESSAGE_CHARS } from "@/lib/chat";
 
 const ChatRequestSchema = z.object({
-  message: z.string().min(1, "Message is required"),
+  message: z
+    .string()
+    .min(1, "Message is required")
+    .max(MAX_MESSAGE_CHARS, `Message must be at most ${MAX_MESSAGE_CHARS} characters`),
   userId: z.string().uuid("Valid user ID is required"),
 });
 
@@ -18,6 +21,9 @@ export async function POST(req: NextRequest) {
     const body: unknown = await req.json();
     const { message, userId } = ChatRequestSchema.parse(body);
 
+    // Loaded on first valid request — the agent graph pulls in the Anthropic
+    // and Supabase SDKs, which invalid requests never need
+    const { handleUserMessage } = await import("@adaptlearn/agent-master");
     const result = await handleUserMessage({ userId, message });
 
     return NextResponse.json({
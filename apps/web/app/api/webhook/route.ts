@@ -1,10 +1,10 @@
 import { NextRequest, NextResponse } from "next/server";
 import { z } from "zod";
 import { pollMessages } from "@adaptlearn/shared/bus";
-import type { AgentName } from "@adaptlearn/shared/types";
+import { AgentName } from "@adaptlearn/shared/types";
 
 const PollRequestSchema = z.object({
-  agent: z.enum(["master", "scout", "content_creator", "assessment", "learning", "chat_ui"]),
+  agent: AgentName,
   limit: z.number().int().min(1).max(50).optional().default(10),
 });
 
@@ -19,7 +19,7 @@ export async function POST(req: NextRequest) {
     const body: unknown = await req.json();
     const { agent, limit } = PollRequestSchema.parse(body);
 
-    const messages = await pollMessages(agent as AgentName, limit);
+    const messages = await pollMessages(agent, limit);
 
     return NextResponse.json({
       messages,
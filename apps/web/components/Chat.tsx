@@ -1,6 +1,7 @@
 "use client";
 
 import { useState, useRef, useEffect } from "react";
+import { MAX_MESSAGE_CHARS } from "@/lib/chat";
 
 interface ChatMessage {
   id: string;
@@ -27,6 +28,8 @@ export default function Chat({ userId }: ChatProps) {
   ]);
   const [input, setInput] = useState("");
   const [loading, setLoading] = useState(false);
+  // Position while recalling earlier messages with ArrowUp/ArrowDown; null when not browsing
+  const [historyIndex, setHistoryIndex] = useState<number | null>(null);
   const messagesEndRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
@@ -46,6 +49,7 @@ export default function Chat({ userId }: ChatProps) {
 
     setMessages((prev) => [...prev, userMsg]);
     setInput("");
+    setHistoryIndex(null);
     setLoading(true);
 
     try {
@@ -84,6 +88,31 @@ export default function Chat({ userId }: ChatProps) {
     }
   }
 
+  /**
+   * Shell-style recall of sent messages: ArrowUp steps back through them,
+   * ArrowDown steps forward and clears the input past the newest one.
+   */
+  function handleKeyDown(e: React.KeyboardEvent<HTMLInputElement>) {
+    if (e.key !== "ArrowUp" && e.key !== "ArrowDown") return;
+
+    const sent = messages.filter((m) => m.role === "user").map((m) => m.content);
+    if (sent.length === 0 || (e.key === "ArrowDown" && historyIndex === null)) return;
+
+    e.preventDefault();
+
+    if (e.key === "ArrowUp") {
+      const next = historyIndex === null ? sent.length - 1 : Math.max(0, historyIndex - 1);
+      setHistoryIndex(next);
+      setInput(sent[next]);
+    } else if (historyIndex !== null && historyIndex < sent.length - 1) {
+      setHistoryIndex(historyIndex + 1);
+      setInput(sent[historyIndex + 1]);
+    } else {
+      setHistoryIndex(null);
+      setInput("");
+    }
+  }
+
   return (
     <div className="flex h-full flex-col">
       {/* Message list */}
@@ -140,7 +169,12 @@ export default function Chat({ userId }: ChatProps) {
           <input
             type="text"
             value={input}
-            onChange={(e) => setInput(e.target.value)}
+            maxLength={MAX_MESSAGE_CHARS}
+            onChange={(e) => {
+              setInput(e.target.value);
+              setHistoryIndex(null);
+            }}
+            onKeyDown={handleKeyDown}
             placeholder="Ask about Agentic AI, Salesforce Agentforce, AI Strategy..."
             className="flex-1 rounded-lg border border-gray-300 px-4 py-2 text-sm focus:border-blue-500 focus:outline-none focus:ring-1 focus:ring-blue-500"
             disabled={loading}
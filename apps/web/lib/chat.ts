@@ -0,0 +1,6 @@
+/**
+ * Longest chat message accepted. The chat input caps typing and pastes at this
+ * length, and /api/chat rejects anything longer before it reaches the Master
+ * Agent, so an oversized paste can't inflate the classifier prompt.
+ */
+export const MAX_MESSAGE_CHARS = 2000;
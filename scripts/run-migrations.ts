@@ -3,7 +3,7 @@
  * Uses the Supabase REST API with service role key.
  * Usage: npx tsx scripts/run-migrations.ts
  */
-import { readFileSync, readdirSync } from "fs";
+import { readFile, readdir } from "fs/promises";
 import { join, dirname } from "path";
 import { fileURLToPath } from "url";
 
@@ -22,18 +22,6 @@ const projectRef = new URL(SUPABASE_URL).hostname.split(".")[0];
 
 async function executeSql(sql: string): Promise<{ success: boolean; error?: string }> {
   // Use Supabase's pg-meta SQL execution endpoint
-  const res = await fetch(`${SUPABASE_URL}/rest/v1/rpc`, {
-    method: "POST",
-    headers: {
-      "Content-Type": "application/json",
-      apikey: SUPABASE_SERVICE_ROLE_KEY!,
-      Authorization: `Bearer ${SUPABASE_SERVICE_ROLE_KEY!}`,
-      Prefer: "return=minimal",
-    },
-    body: JSON.stringify({}),
-  });
-
-  // This likely won't work for DDL, so try the pg-meta endpoint
   const pgMetaRes = await fetch(
     `${SUPABASE_URL}/pg/query`,
     {
@@ -77,19 +65,19 @@ async function executeSql(sql: string): Promise<{ success: boolean; error?: stri
 
 async function runMigrations() {
   const migrationsDir = join(__dirname, "migrations");
-  const files = readdirSync(migrationsDir)
+  const files = (await readdir(migrationsDir))
     .filter((f) => f.endsWith(".sql"))
     .sort();
 
   console.log(`Found ${files.length} migration files`);
   console.log(`Target: ${SUPABASE_URL} (ref: ${projectRef})\n`);
 
-  // Combine all migrations into one SQL block
+  // Read the files in parallel, then combine them into one SQL block in order
+  const sqlByFile = await Promise.all(
+    files.map((file) => readFile(join(migrationsDir, file), "utf-8"))
+  );
   const allSql = files
-    .map((file) => {
-      const sql = readFileSync(join(migrationsDir, file), "utf-8");
-      return `-- === ${file} ===\n${sql}`;
-    })
+    .map((file, i) => `-- === ${file} ===\n${sqlByFile[i]}`)
     .join("\n\n");
 
   console.log("Running all migrations as a single batch...\n");
@@ -98,11 +86,18 @@ async function runMigrations() {
   if (result.success) {
     console.log("✓ All migrations applied successfully!");
   } else {
-    console.log(`✗ Migration failed: ${result.error}`);
-    console.log("\n--- Combined SQL (copy to Supabase SQL Editor) ---\n");
-    console.log(allSql);
-    console.log("\n--- End SQL ---");
-    console.log("\nPaste the SQL above into your Supabase SQL Editor and click Run.");
+    // The combined SQL can run to thousands of lines — emit the whole fallback
+    // report in one write rather than one console.log per section
+    process.stdout.write(
+      [
+        `✗ Migration failed: ${result.error}`,
+        "\n--- Combined SQL (copy to Supabase SQL Editor) ---\n",
+        allSql,
+        "\n--- End SQL ---",
+        "\nPaste the SQL above into your Supabase SQL Editor and click Run.",
+        "",
+      ].join("\n")
+    );
   }
 }
 